@@ -101,9 +101,9 @@ async def _():
             play=args.play,
         )
         return
-    for url in urls:
-        await api.download(
-            url=url,
+    if len(urls) > 1:
+        await api.download_many(
+            urls,
             path_folder=args.folder if args.folder else None,
             quality=args.quality if args.quality else "1080",
             filename_style=args.filenameStyle if args.filenameStyle else "pretty",
@@ -114,6 +114,25 @@ async def _():
             show=args.show,
             play=args.play,
         )
+        print(
+            f"Settled on {api.transfer_controller.limit} parallel downloads."
+            if api.transfer_controller.settled
+            else f"Finished with a limit of {api.transfer_controller.limit} parallel downloads."
+        )
+    else:
+        for url in urls:
+            await api.download(
+                url=url,
+                path_folder=args.folder if args.folder else None,
+                quality=args.quality if args.quality else "1080",
+                filename_style=args.filenameStyle if args.filenameStyle else "pretty",
+                audio_format=args.audioFormat if args.audioFormat else "mp3",
+                youtube_video_codec=args.youtubeVideoCodec
+                if args.youtubeVideoCodec
+                else None,
+                show=args.show,
+                play=args.play,
+            )
     print(
         "\033[92mEverything Done!\033[0m Thanks for using pybalt! Leave a star on GitHub: https://github.com/nichind/pybalt"
     )
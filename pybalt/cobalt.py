@@ -7,10 +7,14 @@ from sys import platform
 from subprocess import run as srun
 from os.path import expanduser
 from time import time
-from typing import Literal
+from typing import Literal, Callable
+from asyncio import Condition, Lock, gather, get_running_loop
 from dotenv import load_dotenv
 from re import findall
 from importlib.metadata import version
+from array import array
+from csv import writer as csv_writer
+from json import dumps
 
 
 async def check_updates() -> bool:
@@ -36,7 +40,40 @@ async def check_updates() -> bool:
     return True
 
 
+def _is_playlist(url: str) -> bool:
+    return len(findall("[&?]list=([^&]+)", url)) > 0
+
+
+def _playlist_urls(url: str) -> list:
+    """
+    Returns the URLs of the videos of a YouTube (Music) playlist.
+    """
+    from pytube import Playlist
+
+    item_urls = list(Playlist(url).video_urls)
+    if url.split(".")[0].endswith("music"):
+        item_urls = [item_url.replace("www", "music") for item_url in item_urls]
+    return item_urls
+
+
+# Statuses cobalt answers with when a tunnel is no longer valid
+EXPIRED_TUNNEL_STATUSES = (401, 403, 404, 410)
+
+
 class File:
+    __slots__ = (
+        "cobalt",
+        "status",
+        "url",
+        "tunnel",
+        "filename",
+        "extension",
+        "params",
+        "resolved_at",
+        "downloaded",
+        "path",
+    )
+
     def __init__(
         self,
         cobalt=None,
@@ -44,6 +81,7 @@ class File:
         url: str = None,
         filename: str = None,
         tunnel: str = None,
+        params: tuple = None,
     ) -> None:
         """
         Creates a new File object.
@@ -54,10 +92,12 @@ class File:
         - url (str): The URL of the file.
         - filename (str): The filename of the file.
         - tunnel (str): The tunnel URL of the file.
+        - params (tuple, optional): The Cobalt.get arguments after url used to resolve the tunnel, reused when it has to be resolved again.
 
         Fields:
         - downloaded (bool): Whether the file has been downloaded.
         - path (str): The path where the file is saved.
+        - resolved_at (float): Timestamp of the moment the tunnel was resolved.
         """
         self.cobalt = cobalt
         self.status = status
@@ -65,21 +105,61 @@ class File:
         self.tunnel = tunnel
         self.filename = filename
         self.extension = self.filename.split(".")[-1] if self.filename else None
+        self.params = params if params else ()
+        self.resolved_at = time()
         self.downloaded = False
         self.path = None
 
-    async def download(self, path_folder: str = None) -> str:
+    def is_expired(self, tunnel_lifetime: float) -> bool:
+        """
+        Whether the tunnel is older than the given tunnel lifetime.
+
+        Parameters:
+        - tunnel_lifetime (float): Seconds after which a tunnel is considered expired.
+        """
+        if self.tunnel is None:
+            return False
+        return time() - self.resolved_at >= tunnel_lifetime
+
+    async def refresh(self, cobalt=None) -> "File":
+        """
+        Resolves the tunnel of this file again, keeping the filename it was created with.
+
+        Parameters:
+        - cobalt (Cobalt, optional): The Cobalt instance to resolve the tunnel with. Defaults to the one associated with this File.
+
+        Returns:
+        - File: This File object with a new tunnel.
+        """
+        if cobalt is None:
+            cobalt = self.cobalt
+        if cobalt is None:
+            raise exceptions.TunnelError(
+                f"Cannot resolve {self.url} again without a Cobalt instance"
+            )
+        file = await cobalt.get(self.url, *self.params)
+        self.status = file.status
+        self.tunnel = file.tunnel
+        self.resolved_at = file.resolved_at
+        return self
+
+    async def download(self, path_folder: str = None, **kwargs) -> str:
         """
         Downloads the file and saves it to the specified folder.
 
         Parameters:
         - path_folder (str, optional): The folder path where the file should be saved. Defaults to the user's downloads folder.
+        - kwargs: Additional arguments passed to Cobalt.download, e.g. silent or on_chunk.
 
         Returns:
         - str: The path to the downloaded file.
         """
         self.path = await self.cobalt.download(
-            self.url, self.filename, path_folder, file=self
+            self.url,
+            filename=self.filename,
+            path_folder=path_folder,
+            file=self,
+            **kwargs,
         )
         self.downloaded = True
         return self.path
@@ -88,9 +168,299 @@ class File:
         return "<Media " + (self.path if self.path else f'"{self.filename}"') + ">"
 
 
+class BatchResult:
+    STATUSES = ("pending", "done", "failed")
+    FIELDS = ("url", "path", "size", "status", "duration", "error")
+
+    def __init__(self, urls: list) -> None:
+        """
+        Creates a new BatchResult object, the columnar result of Cobalt.download_many.
+
+        Every column is stored as one list or array instead of one object per item.
+
+        Parameters:
+        - urls (list): The URLs of the batch.
+
+        Fields:
+        - urls (list): The URLs of the batch.
+        - paths (list): The paths to the downloaded files, None for the ones not downloaded.
+        - sizes (array): Bytes downloaded for every item.
+        - statuses (array): Index of the status of every item in STATUSES.
+        - durations (array): Seconds spent resolving and downloading every item, not counting the wait for a free slot.
+        - errors (dict): Error messages of the failed items by their index.
+        """
+        self.urls = list(urls)
+        self.paths = [None] * len(self.urls)
+        self.sizes = array("q", bytes(8 * len(self.urls)))
+        self.statuses = array("B", bytes(len(self.urls)))
+        self.durations = array("d", bytes(8 * len(self.urls)))
+        self.errors = {}
+
+    def set(
+        self,
+        index: int,
+        path: str = None,
+        size: int = 0,
+        duration: float = 0.0,
+        error: str = None,
+    ) -> None:
+        """
+        Stores the outcome of an item, marking it failed if error is given and done otherwise.
+        """
+        self.paths[index] = path
+        self.sizes[index] = size
+        self.durations[index] = duration
+        self.statuses[index] = self.STATUSES.index(
+            "failed" if error is not None else "done"
+        )
+        if error is not None:
+            self.errors[index] = error
+
+    def row(self, index: int) -> tuple:
+        """
+        Returns the item at index as a tuple of FIELDS.
+        """
+        if index < 0:
+            index += len(self.urls)
+        if not 0 <= index < len(self.urls):
+            raise IndexError("BatchResult index out of range")
+        return (
+            self.urls[index],
+            self.paths[index],
+            self.sizes[index],
+            self.STATUSES[self.statuses[index]],
+            self.durations[index],
+            self.errors.get(index),
+        )
+
+    def rows(self):
+        """
+        Yields every item as a tuple of FIELDS.
+        """
+        for index in range(len(self.urls)):
+            yield self.row(index)
+
+    def count(self, status: str) -> int:
+        """
+        Returns the number of items with the given status.
+        """
+        return self.statuses.count(self.STATUSES.index(status))
+
+    def to_csv(self, file_path: str) -> None:
+        """
+        Writes the batch to a CSV file with a header row of FIELDS.
+        """
+        with open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv_writer(f)
+            writer.writerow(self.FIELDS)
+            writer.writerows(self.rows())
+
+    def to_jsonl(self, file_path: str) -> None:
+        """
+        Writes the batch to a JSON lines file, one object per item.
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            for row in self.rows():
+                f.write(dumps(dict(zip(self.FIELDS, row)), ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __getitem__(self, index: int | slice) -> tuple | list:
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self.urls)))]
+        return self.row(index)
+
+    def __repr__(self):
+        return f"<BatchResult {self.count('done')}/{len(self)} done>"
+
+
+class ConcurrencyController:
+    # Errors caused by the requested content itself and not by load on the instance
+    ignored_errors = (exceptions.LinkError, exceptions.ContentError)
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 16,
+        window: float = 5.0,
+        increase: int = 1,
+        decrease: float = 0.5,
+        error_threshold: float = 0.2,
+        tolerance: float = 0.05,
+    ) -> None:
+        """
+        Creates a new ConcurrencyController object, an AIMD limiter for the number of tasks running at once.
+
+        Every window the controller compares the throughput of the window to the previous one.
+        The limit is raised by `increase` while throughput keeps climbing, lowered by `increase` when it is flat,
+        and multiplied by `decrease` when the share of failed tasks exceeds `error_threshold`.
+        If throughput drops right after lowering the limit, the previous limit was the one that saturated it,
+        so the controller goes back to it and holds it until throughput climbs past it or errors spike.
+
+        Parameters:
+        - initial (int, optional): The limit to start with. Defaults to 2.
+        - minimum (int, optional): The lowest limit. Defaults to 1.
+        - maximum (int, optional): The highest limit. Defaults to 16.
+        - window (float, optional): Seconds between two adjustments. Defaults to 5.
+        - increase (int, optional): Additive step of the limit. Defaults to 1.
+        - decrease (float, optional): Multiplicative factor applied on error spikes. Defaults to 0.5.
+        - error_threshold (float, optional): Share of failed tasks in a window considered an error spike. Defaults to 0.2.
+        - tolerance (float, optional): Relative throughput gain under which throughput is considered flat. Defaults to 0.05.
+
+        Fields:
+        - limit (int): The current number of tasks allowed to run at once.
+        - active (int): The number of tasks running right now.
+        - history (list): Every adjustment as a dict with time, limit, throughput, errors and reason.
+        - settled (bool): Whether the controller holds the limit it found to saturate throughput.
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(initial, maximum))
+        self.window = window
+        self.increase = increase
+        self.decrease = decrease
+        self.error_threshold = error_threshold
+        self.tolerance = tolerance
+        self.active = 0
+        self.history = []
+        self.throughput = 0.0
+        self._waiters = []
+        self._window_start = time()
+        self._amount = 0
+        self._done = 0
+        self._errors = 0
+        self._last_throughput = None
+        self._last_reason = None
+        self._settled_throughput = None
+
+    async def __aenter__(self) -> "ConcurrencyController":
+        while self.active >= self.limit:
+            waiter = get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self.active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.record(
+            error=exc_type is not None and not issubclass(exc_type, self.ignored_errors)
+        )
+        self.active -= 1
+        self._wake()
+
+    def reset(self) -> None:
+        """
+        Starts a new run from the current limit, forgetting the windows and settled throughput of the previous ones.
+        """
+        self._window_start = time()
+        self._amount = self._done = self._errors = 0
+        self._last_throughput = None
+        self._last_reason = None
+        self._settled_throughput = None
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def record(self, amount: float = 0, error: bool = None) -> None:
+        """
+        Records progress of the running tasks and adjusts the limit once the window is over.
+
+        Parameters:
+        - amount (float, optional): Units of work done, e.g. bytes transferred.
+        - error (bool, optional): Whether a task has finished with an error, None if no task has finished.
+        """
+        self._amount += amount
+        if error is not None:
+            self._done += 1
+            self._errors += 1 if error else 0
+        if time() - self._window_start >= self.window:
+            self.adjust()
+
+    def adjust(self) -> int:
+        """
+        Closes the current window and picks the limit for the next one.
+
+        Returns:
+        - int: The new limit.
+        """
+        now = time()
+        self.throughput = self._amount / max(now - self._window_start, 1e-9)
+        error_rate = self._errors / self._done if self._done else 0
+        if error_rate > self.error_threshold:
+            limit, reason = int(self.limit * self.decrease), "errors"
+            self._settled_throughput = None
+        elif self.active < self.limit:
+            # Not enough tasks to fill the limit, throughput says nothing about it
+            limit, reason = self.limit, "idle"
+        elif self._settled_throughput is not None:
+            if self.throughput > self._settled_throughput * (1 + self.tolerance):
+                limit, reason = self.limit + self.increase, "increase"
+                self._settled_throughput = None
+            else:
+                limit, reason = self.limit, "settled"
+        elif (
+            self._last_throughput is None
+            or self.throughput > self._last_throughput * (1 + self.tolerance)
+        ):
+            limit, reason = self.limit + self.increase, "increase"
+        elif self._last_reason == "flat" and self.throughput < self._last_throughput * (
+            1 - self.tolerance
+        ):
+            limit, reason = self.limit + self.increase, "settled"
+            self._settled_throughput = self._last_throughput
+        else:
+            limit, reason = self.limit - self.increase, "flat"
+        limit = max(self.minimum, min(limit, self.maximum))
+        if limit != self.limit:
+            self.history.append(
+                {
+                    "time": now,
+                    "limit": limit,
+                    "throughput": self.throughput,
+                    "errors": self._errors,
+                    "reason": reason,
+                }
+            )
+        self.limit = limit
+        self._last_throughput = self.throughput
+        self._last_reason = reason
+        self._window_start = now
+        self._amount = self._done = self._errors = 0
+        self._wake()
+        return self.limit
+
+    @property
+    def settled(self) -> bool:
+        return self._settled_throughput is not None
+
+    def metrics(self) -> dict:
+        """
+        Returns the current state of the controller.
+
+        Returns:
+        - dict: limit, active, settled, throughput (units per second in the last window) and the history of adjustments.
+        """
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "settled": self.settled,
+            "throughput": self.throughput,
+            "history": list(self.history),
+        }
+
+
 class Cobalt:
     def __init__(
-        self, api_instance: str = None, api_key: str = None, headers: dict = None
+        self,
+        api_instance: str = None,
+        api_key: str = None,
+        headers: dict = None,
+        tunnel_lifetime: float = None,
     ) -> None:
         """
         Creates a new Cobalt object.
@@ -99,13 +469,18 @@ class Cobalt:
         - api_instance (str, optional): The URL of the Cobalt API instance to use. Defaults to https://dwnld.nichind.dev.
         - api_key (str, optional): The API key to use for the Cobalt API instance. Defaults to "".
         - headers (dict, optional): The headers to use for requests to the Cobalt API instance. Defaults to a dictionary with Accept, Content-Type, and Authorization headers.
+        - tunnel_lifetime (float, optional): Seconds after which a resolved tunnel is considered expired and is resolved again before downloading. Defaults to 60.
 
         Environment variables:
         - COBALT_API_URL: The URL of the Cobalt API instance to use.
         - COBALT_API_KEY: The API key to use for the Cobalt API instance.
         - COBALT_USER_AGENT: The User-Agent header to use for requests to the Cobalt API instance. Defaults to "pybalt/python".
+        - COBALT_TUNNEL_LIFETIME: Seconds after which a resolved tunnel is considered expired.
         """
         load_dotenv()
+        if tunnel_lifetime is None:
+            tunnel_lifetime = float(getenv("COBALT_TUNNEL_LIFETIME", 60))
+        self.tunnel_lifetime = tunnel_lifetime
         if api_instance is None:
             if getenv("COBALT_API_URL"):
                 api_instance = getenv("COBALT_API_URL")
@@ -141,6 +516,18 @@ class Cobalt:
         if self.headers["Authorization"] == "":
             del self.headers["Authorization"]
         self.skipped_instances = []
+        self._instance_lock = Lock()
+        self._params = {}
+        self.transfer_controller = ConcurrencyController(initial=2, maximum=16)
+
+    def metrics(self) -> dict:
+        """
+        Returns the state of the concurrency controller used by download_many.
+
+        Returns:
+        - dict: Metrics of the transfer controller, see ConcurrencyController.metrics.
+        """
+        return {"transfer": self.transfer_controller.metrics()}
 
     async def get_instance(self):
         """
@@ -194,6 +581,24 @@ class Cobalt:
                         good_instances.pop(0)
         return self.api_instance
 
+    async def skip_instance(self, instance: str) -> str:
+        """
+        Adds a failing instance to the skipped instances and switches to another one.
+
+        Parallel requests that fail on the same instance switch only once, the first one does it for all of them.
+
+        Parameters:
+        - instance (str): The URL of the instance the request failed on.
+
+        Returns:
+        - str: The URL of the instance to use now.
+        """
+        async with self._instance_lock:
+            if self.api_instance == instance:
+                self.skipped_instances.append(instance)
+                await self.get_instance()
+        return self.api_instance
+
     async def get(
         self,
         url: str,
@@ -224,15 +629,17 @@ class Cobalt:
         - ContentError: If the content of the URL cannot be retrieved.
         - InvalidBody: If the request body is invalid.
         - AuthError: If authentication fails.
+        - RateLimitError: If the instance rate limits the requests.
         - UnrecognizedError: If an unrecognized error occurs.
         - BadInstance: If the Cobalt API instance cannot be reached.
         """
         async with ClientSession(headers=self.headers) as cs:
-            if not self.api_instance or self.api_instance.strip().replace(
-                "https://", ""
-            ).replace("http://", "").lower() in ["f", "fetch", "get"]:
-                print("Fetching instance...\r", end="")
-                await self.get_instance()
+            async with self._instance_lock:
+                if not self.api_instance or self.api_instance.strip().replace(
+                    "https://", ""
+                ).replace("http://", "").lower() in ["f", "fetch", "get"]:
+                    print("Fetching instance...\r", end="")
+                    await self.get_instance()
             try:
                 if quality not in [
                     "max",
@@ -271,7 +678,8 @@ class Cobalt:
                 if audio_format:
                     json["audioFormat"] = audio_format
                 # print(json)
-                async with cs.post(self.api_instance, json=json) as resp:
+                instance = self.api_instance
+                async with cs.post(instance, json=json) as resp:
                     json = await resp.json()
                     if "error" in json:
                         match json["error"]["code"].split(".")[2]:
@@ -283,6 +691,10 @@ class Cobalt:
                                 raise exceptions.ContentError(
                                     f'cannot get content of {url} - {json["error"]["code"]}'
                                 )
+                            case "rate_exceeded":
+                                raise exceptions.RateLimitError(
+                                    f'Rate limit of {instance} exceeded - {json["error"]["code"]}'
+                                )
                             case "invalid_body":
                                 raise exceptions.InvalidBody(
                                     f'Request body is invalid - {json["error"]["code"]}'
@@ -293,8 +705,7 @@ class Cobalt:
                                     or json["error"]["code"].split(".")[-1]
                                     == "not_found"
                                 ):
-                                    self.skipped_instances.append(self.api_instance)
-                                    await self.get_instance()
+                                    await self.skip_instance(instance)
                                     return await self.get(
                                         url,
                                         quality,
@@ -307,8 +718,7 @@ class Cobalt:
                                     f'Authentication failed - {json["error"]["code"]}'
                                 )
                             case "youtube":
-                                self.skipped_instances.append(self.api_instance)
-                                await self.get_instance()
+                                await self.skip_instance(instance)
                                 return await self.get(
                                     url,
                                     quality,
@@ -318,12 +728,13 @@ class Cobalt:
                                     youtube_video_codec,
                                 )
                             case "fetch":
-                                self.skipped_instances.append(self.api_instance)
+                                # Let a running download_many see the failure before it is retried
+                                self.transfer_controller.record(error=True)
                                 print(
-                                    f'Fetch {url if len(url) < 40 else url[:40] + "..."} using {self.api_instance} failed, trying next instance...\r',
+                                    f'Fetch {url if len(url) < 40 else url[:40] + "..."} using {instance} failed, trying next instance...\r',
                                     end="",
                                 )
-                                await self.get_instance()
+                                await self.skip_instance(instance)
                                 return await self.get(
                                     url,
                                     quality,
@@ -335,17 +746,24 @@ class Cobalt:
                         raise exceptions.UnrecognizedError(
                             f'{json["error"]["code"]} - {json["error"]}'
                         )
+                    params = (
+                        quality,
+                        download_mode,
+                        filename_style,
+                        audio_format,
+                        youtube_video_codec,
+                    )
+                    # Files resolved with the same options share one params tuple
                     return File(
                         cobalt=self,
                         status=json["status"],
                         url=url.replace("'", "").replace('"', "").replace("\\", ""),
                         tunnel=json["url"],
                         filename=json["filename"],
+                        params=self._params.setdefault(params, params),
                     )
             except client_exceptions.ClientConnectorError:
-                raise exceptions.BadInstance(
-                    f"Cannot reach instance {self.api_instance}"
-                )
+                raise exceptions.BadInstance(f"Cannot reach instance {instance}")
 
     async def download(
         self,
@@ -361,7 +779,9 @@ class Cobalt:
         file: File = None,
         show: bool = None,
         play: bool = None,
-    ) -> str:
+        silent: bool = False,
+        on_chunk: Callable[[int], None] = None,
+    ) -> "str | BatchResult":
         """
         Downloads a file from a specified URL or playlist, saving it to a given path with optional quality, filename, and format settings.
 
@@ -376,35 +796,33 @@ class Cobalt:
         - youtube_video_codec (Literal['vp9', 'h264'], optional): Codec for YouTube video downloads.
         - playlist (bool or str, optional): Whether the URL is a playlist link, you can also pass a playlist link here.
         - file (File, optional): A pre-existing File object to use for the download.
+        - silent (bool, optional): Whether to skip printing the progress of the download.
+        - on_chunk (Callable[[int], None], optional): Called with the size of every chunk written to disk.
 
         Returns:
         - str: The path to the downloaded file.
+        - BatchResult: The results of download_many for a playlist.
 
         Raises:
         - BadInstance: If the specified instance cannot be reached.
+        - TunnelError: If the tunnel of the file does not respond with the file, even after resolving it again.
         """
-        if playlist or len(findall("[&?]list=([^&]+)", url)) > 0:
+        if url is None and file is not None:
+            url = file.url
+        if playlist or _is_playlist(url):
             if type(playlist) is str:
                 url = playlist
-
-            from pytube import Playlist
-
-            playlist = Playlist(url)
-            for i, item_url in enumerate(playlist.video_urls):
-                if url.split(".")[0].endswith("music"):
-                    item_url.replace("www", "music")
-                print(f"[{i + 1}/{len(playlist.video_urls)}] {item_url}")
-                await self.download(
-                    item_url,
-                    quality=quality,
-                    filename=filename,
-                    path_folder=path_folder,
-                    download_mode=download_mode,
-                    filename_style=filename_style,
-                    audio_format=audio_format,
-                    youtube_video_codec=youtube_video_codec,
-                )
-            return
+            return await self.download_many(
+                _playlist_urls(url),
+                quality=quality,
+                path_folder=path_folder,
+                download_mode=download_mode,
+                filename_style=filename_style,
+                audio_format=audio_format,
+                youtube_video_codec=youtube_video_codec,
+                show=show,
+                play=play,
+            )
         if file is None:
             file = await self.get(
                 url,
@@ -414,6 +832,8 @@ class Cobalt:
                 audio_format=audio_format,
                 youtube_video_codec=youtube_video_codec,
             )
+        elif file.is_expired(self.tunnel_lifetime):
+            await file.refresh(self)
         if filename is None:
             filename = file.filename
         if path_folder and path_folder[-1] != "/":
@@ -429,6 +849,16 @@ class Cobalt:
             return s[: free_columns - 6] + "..." if len(s) + 3 > free_columns else s
 
         async with ClientSession(headers=self.headers) as session:
+            response = await session.get(file.tunnel)
+            if response.status in EXPIRED_TUNNEL_STATUSES:
+                response.release()
+                await file.refresh(self)
+                response = await session.get(file.tunnel)
+            if not response.ok:
+                response.release()
+                raise exceptions.TunnelError(
+                    f"Tunnel of {file.url} responded with {response.status}"
+                )
             async with aopen(path.join(path_folder, filename), "wb") as f:
                 try:
                     progress_chars = ["⢎⡰", "⢎⡡", "⢎⡑", "⢎⠱", "⠎⡱", "⢊⡱", "⢌⡱", "⢆⡱"]
@@ -438,8 +868,9 @@ class Cobalt:
                     last_update = 0
                     last_speed_update = 0
                     downloaded_since_last = 0
-                    async with session.get(file.tunnel) as response:
-                        print(f"\033[97m{filename}\033[0m", flush=True)
+                    async with response:
+                        if not silent:
+                            print(f"\033[97m{filename}\033[0m", flush=True)
                         result_path = path.join(path_folder, f'"{filename}"')
                         while True:
                             chunk = await response.content.read(1024 * 1024)
@@ -448,6 +879,10 @@ class Cobalt:
                             await f.write(chunk)
                             total_size += len(chunk)
                             downloaded_since_last += len(chunk)
+                            if on_chunk:
+                                on_chunk(len(chunk))
+                            if silent:
+                                continue
                             if time() - last_update > 0.2:
                                 progress_index += 1
                                 if progress_index > len(progress_chars) - 1:
@@ -478,14 +913,15 @@ class Cobalt:
                                     end="",
                                 )
                     elapsed_time = time() - start_time
-                    info = f"[{round(total_size / 1024 / 1024, 2)}Mb \u2015 {round(elapsed_time, 2)}s] \u2713"
-                    print_line = shorten(result_path, additional_len=len(info))
-                    print(
-                        "\r",
-                        print_line
-                        + " " * (max_print_length - len(print_line + " " + info)),
-                        f"\033[97m{info[:-1]}\033[92m{info[-1:]}\033[0m",
-                    )
+                    if not silent:
+                        info = f"[{round(total_size / 1024 / 1024, 2)}Mb \u2015 {round(elapsed_time, 2)}s] \u2713"
+                        print_line = shorten(result_path, additional_len=len(info))
+                        print(
+                            "\r",
+                            print_line
+                            + " " * (max_print_length - len(print_line + " " + info)),
+                            f"\033[97m{info[:-1]}\033[92m{info[-1:]}\033[0m",
+                        )
                     if play:
                         if platform == "win32":
                             from os import startfile
@@ -521,5 +957,161 @@ class Cobalt:
                 except KeyboardInterrupt:
                     return
 
+    async def download_many(
+        self,
+        urls: list,
+        quality: str = None,
+        path_folder: str = None,
+        download_mode: Literal["auto", "audio", "mute"] = "auto",
+        filename_style: Literal["classic", "pretty", "basic", "nerdy"] = "pretty",
+        audio_format: Literal["best", "mp3", "ogg", "wav", "opus"] = None,
+        youtube_video_codec: Literal["vp9", "h264"] = None,
+        show: bool = None,
+        play: bool = None,
+    ) -> "BatchResult":
+        """
+        Downloads several URLs in parallel, letting transfer_controller pick how many run at once.
+
+        URLs are resolved before they take a transfer slot, at most one per transfer slot ahead,
+        so tunnels are fresh when their transfer starts and requests to the instance follow the transfer limit.
+        Failed requests to the instance, like fetch errors and rate limits, count as errors of the transfer controller.
+
+        Parameters:
+        - urls (list): The URLs of the videos or media to download, playlist links are expanded into their videos.
+        - quality (str, optional): The desired quality of the downloads.
+        - path_folder (str, optional): The folder path where the files should be saved.
+        - download_mode (Literal['auto', 'audio', 'mute'], optional): The mode of download, affecting audio and video handling.
+        - filename_style (Literal['classic', 'pretty', 'basic', 'nerdy'], optional): Style of the filenames.
+        - audio_format (Literal['best', 'mp3', 'ogg', 'wav', 'opus'], optional): Audio format for the downloads if applicable.
+        - youtube_video_codec (Literal['vp9', 'h264'], optional): Codec for YouTube video downloads.
+        - show (bool, optional): Whether to show every downloaded file in the file manager.
+        - play (bool, optional): Whether to play every downloaded file.
+
+        Returns:
+        - BatchResult: The paths, sizes, statuses and timings of the downloads in the order of urls.
+        """
+        self.transfer_controller.reset()
+        results = BatchResult(
+            [
+                item_url
+                for url in urls
+                for item_url in (_playlist_urls(url) if _is_playlist(url) else [url])
+            ]
+        )
+        queue = iter(enumerate(results.urls))
+        done = 0
+        # Items being resolved or waiting for a transfer slot
+        ahead = 0
+        # Filenames being written, items with the same filename wait for each other like sequential downloads did
+        writing = set()
+        changed = Condition()
+
+        async def leave_ahead() -> None:
+            nonlocal ahead
+            async with changed:
+                ahead -= 1
+                changed.notify_all()
+
+        async def download_item(
+            i: int, url: str, on_chunk: Callable[[int], None]
+        ) -> str:
+            nonlocal ahead
+            async with changed:
+                await changed.wait_for(lambda: ahead < self.transfer_controller.limit)
+                ahead += 1
+            start_time = time()
+            try:
+                file = await self.get(
+                    url,
+                    quality=quality,
+                    download_mode=download_mode,
+                    filename_style=filename_style,
+                    audio_format=audio_format,
+                    youtube_video_codec=youtube_video_codec,
+                )
+            except BaseException as exc:
+                await leave_ahead()
+                if isinstance(exc, Exception) and not isinstance(
+                    exc, self.transfer_controller.ignored_errors
+                ):
+                    self.transfer_controller.record(error=True)
+                raise
+            finally:
+                results.durations[i] += time() - start_time
+            try:
+                async with changed:
+                    await changed.wait_for(lambda: file.filename not in writing)
+                    writing.add(file.filename)
+            except BaseException:
+                await leave_ahead()
+                raise
+            try:
+                async with self.transfer_controller:
+                    await leave_ahead()
+                    start_time = time()
+                    try:
+                        return await file.download(
+                            path_folder,
+                            silent=True,
+                            on_chunk=on_chunk,
+                            show=show,
+                            play=play,
+                        )
+                    finally:
+                        results.durations[i] += time() - start_time
+            finally:
+                async with changed:
+                    writing.discard(file.filename)
+                    changed.notify_all()
+
+        async def worker() -> None:
+            nonlocal done
+            for i, url in queue:
+                size = 0
+
+                def on_chunk(chunk_size: int) -> None:
+                    nonlocal size
+                    size += chunk_size
+                    self.transfer_controller.record(chunk_size)
+
+                try:
+                    result_path = await download_item(i, url, on_chunk)
+                except Exception as exc:
+                    results.set(
+                        i,
+                        size=size,
+                        duration=results.durations[i],
+                        error=str(exc) or type(exc).__name__,
+                    )
+                    done += 1
+                    print(f"[{done}/{len(results)}] \033[91m{url}\033[0m - {exc}")
+                    continue
+                if result_path is None:
+                    results.set(
+                        i,
+                        size=size,
+                        duration=results.durations[i],
+                        error="Download was interrupted",
+                    )
+                    done += 1
+                    print(
+                        f"[{done}/{len(results)}] \033[91m{url}\033[0m - Download was interrupted"
+                    )
+                    continue
+                results.set(i, result_path, size, results.durations[i])
+                done += 1
+                print(
+                    f"[{done}/{len(results)}] \033[97m{result_path}\033[0m \033[92m\u2713\033[0m"
+                )
+
+        # Enough workers to fill every transfer slot and resolve one item ahead of each
+        await gather(
+            *(
+                worker()
+                for _ in range(min(len(results), 2 * self.transfer_controller.maximum))
+            )
+        )
+        return results
+
 
 Pybalt = Cobalt
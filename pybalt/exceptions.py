@@ -20,3 +20,11 @@ class InvalidBody(Exception):
 
 class AuthError(Exception):
     pass
+
+
+class TunnelError(Exception):
+    pass
+
+
+class RateLimitError(Exception):
+    pass
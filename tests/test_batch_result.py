@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from pybalt.cobalt import BatchResult
+
+
+def make_result():
+    result = BatchResult(["a", "b", "c"])
+    result.set(0, "/tmp/a.mp4", 100, 1.5)
+    result.set(2, size=10, duration=0.5, error="bad, link")
+    return result
+
+
+def test_rows_and_indexing():
+    result = make_result()
+    assert len(result) == 3
+    assert result[0] == ("a", "/tmp/a.mp4", 100, "done", 1.5, None)
+    assert result[-1] == ("c", None, 10, "failed", 0.5, "bad, link")
+    assert result[0:2] == [result[0], result[1]]
+    assert result[::-1][0] == result[2]
+    assert result.count("pending") == 1
+    with pytest.raises(IndexError):
+        result[3]
+
+
+def test_export(tmp_path):
+    result = make_result()
+    result.to_csv(tmp_path / "result.csv")
+    result.to_jsonl(tmp_path / "result.jsonl")
+    lines = (tmp_path / "result.csv").read_text().splitlines()
+    assert lines[0] == ",".join(BatchResult.FIELDS)
+    assert lines[3] == 'c,,10,failed,0.5,"bad, link"'
+    rows = [json.loads(line) for line in open(tmp_path / "result.jsonl")]
+    assert rows[1] == dict(zip(BatchResult.FIELDS, result[1]))
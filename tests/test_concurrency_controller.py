@@ -0,0 +1,65 @@
+import pybalt.cobalt as cobalt
+from pybalt.cobalt import ConcurrencyController
+
+
+def make_controller(monkeypatch, **kwargs):
+    clock = [0.0]
+    monkeypatch.setattr(cobalt, "time", lambda: clock[0])
+    return ConcurrencyController(window=1.0, **kwargs), clock
+
+
+def run_windows(controller, clock, throughput_at, windows, errors=0):
+    limits = []
+    for _ in range(windows):
+        controller.active = controller.limit
+        clock[0] += controller.window
+        for _ in range(errors):
+            controller.record(error=True)
+        controller.record(throughput_at(controller.limit) * controller.window)
+        limits.append(controller.limit)
+    return limits
+
+
+def test_settles_on_saturating_limit(monkeypatch):
+    controller, clock = make_controller(monkeypatch, initial=2, maximum=16)
+    limits = run_windows(controller, clock, lambda limit: min(limit, 6) * 100, 40)
+    assert max(limits) == 7
+    assert limits[-20:] == [6] * 20
+    assert controller.settled
+    assert controller.metrics()["limit"] == 6
+
+
+def test_resumes_increasing_when_throughput_grows(monkeypatch):
+    controller, clock = make_controller(monkeypatch, initial=2, maximum=16)
+    run_windows(controller, clock, lambda limit: min(limit, 6) * 100, 20)
+    limits = run_windows(controller, clock, lambda limit: min(limit, 10) * 200, 20)
+    assert limits[-1] == 10
+    assert controller.settled
+
+
+def test_error_spike_cuts_limit(monkeypatch):
+    controller, clock = make_controller(monkeypatch, initial=8, maximum=16)
+    run_windows(controller, clock, lambda limit: limit * 100, 1, errors=1)
+    assert controller.limit == 4
+    assert controller.history[-1]["reason"] == "errors"
+
+
+def test_holds_limit_when_idle(monkeypatch):
+    controller, clock = make_controller(monkeypatch, initial=4, maximum=16)
+    controller.active = 1
+    clock[0] += controller.window
+    controller.record(100)
+    assert controller.limit == 4
+
+
+def test_reset_starts_a_new_run(monkeypatch):
+    controller, clock = make_controller(monkeypatch, initial=2, maximum=16)
+    run_windows(controller, clock, lambda limit: min(limit, 6) * 100, 20)
+    assert controller.settled
+    clock[0] += 600
+    controller.reset()
+    limits = run_windows(controller, clock, lambda limit: min(limit, 3) * 10, 1)
+    assert limits == [7]
+    assert controller.history[-1]["reason"] == "increase"
+    assert controller.throughput == 30
+    assert not controller.settled
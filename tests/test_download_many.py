@@ -0,0 +1,152 @@
+import asyncio
+
+from aiohttp import web
+
+import pybalt.cobalt as cobalt
+from pybalt.cobalt import Cobalt, File
+
+
+def make_cobalt(transfer_time=0.0):
+    """
+    Returns a Cobalt with stubbed get and download, and the list of download calls.
+    """
+    api = Cobalt(api_instance="http://127.0.0.1")
+    downloads = []
+
+    async def get(url, **params):
+        return File(cobalt=api, url=url, tunnel="t", filename=url + ".bin")
+
+    async def download(url=None, filename=None, path_folder=None, file=None, **kwargs):
+        downloads.append((file.url, kwargs))
+        await asyncio.sleep(transfer_time)
+        kwargs["on_chunk"](10)
+        return filename
+
+    api.get = get
+    api.download = download
+    return api, downloads
+
+
+def test_expands_playlist_links(monkeypatch):
+    monkeypatch.setattr(
+        cobalt,
+        "_playlist_urls",
+        lambda url: ["https://youtu.be/1", "https://youtu.be/2"],
+    )
+    api, downloads = make_cobalt()
+    result = asyncio.run(
+        api.download_many(
+            ["https://youtu.be/0", "https://youtube.com/playlist?list=PL1"], show=True
+        )
+    )
+    assert result.urls == [
+        "https://youtu.be/0",
+        "https://youtu.be/1",
+        "https://youtu.be/2",
+    ]
+    assert result.count("done") == 3
+    assert all(kwargs["show"] for _, kwargs in downloads)
+
+
+def serve_api(test):
+    """
+    Runs test(base_url) against a local cobalt API where /fetch fails to fetch, /limited is rate limited and /ok works.
+    """
+
+    async def run():
+        async def handle(request):
+            name = request.match_info["name"]
+            if name == "fetch":
+                return web.json_response({"error": {"code": "error.api.fetch.fail"}})
+            if name == "limited":
+                return web.json_response({"error": {"code": "error.api.rate_exceeded"}})
+            return web.json_response(
+                {"status": "tunnel", "url": "http://tunnel", "filename": "a.bin"}
+            )
+
+        app = web.Application()
+        app.router.add_post("/{name}", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        try:
+            return await test(f"http://127.0.0.1:{runner.addresses[0][1]}")
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def test_fetch_errors_switch_instance_once_and_reach_controller():
+    async def test(base_url):
+        api = Cobalt(api_instance=base_url + "/fetch")
+        switches = []
+
+        async def get_instance():
+            switches.append(api.api_instance)
+            await asyncio.sleep(0.01)
+            api.api_instance = base_url + "/ok"
+            return api.api_instance
+
+        api.get_instance = get_instance
+        files = await asyncio.gather(*(api.get(f"u{i}") for i in range(5)))
+        assert [file.tunnel for file in files] == ["http://tunnel"] * 5
+        assert switches == [base_url + "/fetch"]
+        assert api.skipped_instances == [base_url + "/fetch"]
+        assert api.transfer_controller._errors == 5
+
+    serve_api(test)
+
+
+def test_rate_limit_counts_as_error():
+    async def test(base_url):
+        api = Cobalt(api_instance=base_url + "/limited")
+        result = await api.download_many(["u1", "u2"])
+        assert result.count("failed") == 2
+        assert "Rate limit" in result.errors[0]
+        assert api.transfer_controller._errors == 2
+
+    serve_api(test)
+
+
+def test_same_filenames_are_not_written_at_once():
+    api, downloads = make_cobalt(transfer_time=0.01)
+    writing = set()
+    overlaps = []
+    download = api.download
+
+    async def exclusive_download(*args, filename=None, **kwargs):
+        overlaps.append(filename in writing)
+        writing.add(filename)
+        try:
+            return await download(*args, filename=filename, **kwargs)
+        finally:
+            writing.discard(filename)
+
+    api.download = exclusive_download
+    result = asyncio.run(api.download_many(["a", "a", "b", "a", "b"]))
+    assert result.count("done") == 5
+    assert not any(overlaps)
+
+
+def test_files_share_params():
+    async def test(base_url):
+        api = Cobalt(api_instance=base_url + "/ok")
+        first, second = await api.get("u1", "720"), await api.get("u2", "720p")
+        assert first.params == ("720", "auto", "pretty", None, None)
+        assert first.params is second.params
+
+    serve_api(test)
+
+
+def test_interrupted_download_is_failed():
+    api, downloads = make_cobalt()
+
+    async def interrupted_download(*args, **kwargs):
+        return None
+
+    api.download = interrupted_download
+    result = asyncio.run(api.download_many(["a", "b"]))
+    assert result.count("failed") == 2
+    assert result[0][3:] == ("failed", result.durations[0], "Download was interrupted")
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+import pybalt.cobalt as cobalt
+from pybalt import exceptions
+from pybalt.cobalt import Cobalt, File
+
+
+def serve_tunnels(test, dead_status=404):
+    """
+    Runs test(base_url, requests) against a local server with a /dead tunnel answering dead_status and an /ok tunnel.
+    """
+
+    async def run():
+        requests = []
+
+        async def handle(request):
+            requests.append(request.path)
+            if request.path == "/ok":
+                return web.Response(body=b"media")
+            return web.Response(status=dead_status, body=b"expired")
+
+        app = web.Application()
+        app.router.add_get("/{name}", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            return await test(f"http://127.0.0.1:{port}", requests)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def make_cobalt(tunnel):
+    """
+    Returns a Cobalt whose get resolves every URL to the given tunnel, and the list of resolved URLs.
+    """
+    api = Cobalt(api_instance="http://127.0.0.1", tunnel_lifetime=60)
+    resolved = []
+
+    async def get(url, *params):
+        resolved.append((url, params))
+        return File(
+            cobalt=api, status="tunnel", url=url, tunnel=tunnel, filename="new.bin"
+        )
+
+    api.get = get
+    return api, resolved
+
+
+def test_is_expired(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(cobalt, "time", lambda: clock[0])
+    file = File(url="u", tunnel="t", filename="a.bin")
+    assert not file.is_expired(60)
+    clock[0] += 60
+    assert file.is_expired(60)
+    assert not File(url="u", filename="a.bin").is_expired(0)
+
+
+def test_refresh_keeps_filename_and_params():
+    api, resolved = make_cobalt("http://new")
+    file = File(url="u", tunnel="http://old", filename="a.bin", params=("720", "auto"))
+    asyncio.run(file.refresh(api))
+    assert file.tunnel == "http://new"
+    assert file.filename == "a.bin"
+    assert resolved == [("u", ("720", "auto"))]
+
+
+def test_refresh_without_cobalt():
+    with pytest.raises(exceptions.TunnelError):
+        asyncio.run(File(url="u", tunnel="t").refresh())
+
+
+def test_download_refreshes_expired_file(tmp_path):
+    async def test(base_url, requests):
+        api, resolved = make_cobalt(base_url + "/ok")
+        api.tunnel_lifetime = 0
+        file = File(url="u", tunnel=base_url + "/dead", filename="a.bin")
+        result = await api.download(file=file, path_folder=str(tmp_path), silent=True)
+        assert requests == ["/ok"]
+        assert len(resolved) == 1
+        return result
+
+    result = serve_tunnels(test)
+    assert open(result, "rb").read() == b"media"
+
+
+@pytest.mark.parametrize("status", cobalt.EXPIRED_TUNNEL_STATUSES)
+def test_download_retries_expired_tunnel(tmp_path, status):
+    async def test(base_url, requests):
+        api, resolved = make_cobalt(base_url + "/ok")
+        file = File(url="u", tunnel=base_url + "/dead", filename="a.bin")
+        result = await api.download(file=file, path_folder=str(tmp_path), silent=True)
+        assert requests == ["/dead", "/ok"]
+        assert len(resolved) == 1
+        return result
+
+    result = serve_tunnels(test, status)
+    assert open(result, "rb").read() == b"media"
+
+
+def test_download_raises_when_refreshed_tunnel_is_dead(tmp_path):
+    async def test(base_url, requests):
+        api, resolved = make_cobalt(base_url + "/dead")
+        file = File(url="u", tunnel=base_url + "/dead", filename="a.bin")
+        with pytest.raises(exceptions.TunnelError):
+            await api.download(file=file, path_folder=str(tmp_path), silent=True)
+        assert requests == ["/dead", "/dead"]
+
+    serve_tunnels(test)
+    assert not (tmp_path / "a.bin").exists()